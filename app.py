@@ -19,9 +19,22 @@ st.set_page_config(
 
 # Initialize chatbot
 @st.cache_resource
-def load_chatbot(use_fasttext=False):
-    """Load and cache the chatbot model."""
-    return BankingChatbot(use_fasttext=use_fasttext)
+def load_chatbot():
+    """Load and cache a single chatbot shared by both embedding backends."""
+    return BankingChatbot()
+
+EXAMPLE_QUESTIONS = (
+    "Kaip atsidaryti banko sąskaitą?",
+    "Kokios yra būsto paskolos palūkanos?",
+    "Kiek kainuoja SEPA pavedimas?",
+    "Ar indėliai apdrausti?",
+    "Ar galima keisti kortelės PIN kodą?"
+)
+
+@st.cache_data
+def precompute_examples(_chatbot, questions, use_fasttext):
+    """Compute and cache responses to the example questions for a backend."""
+    return {question: _chatbot.get_response(question, use_fasttext=use_fasttext) for question in questions}
 
 # Sidebar for settings
 with st.sidebar:
@@ -55,19 +68,17 @@ if "messages" not in st.session_state:
 # Initialize chatbot
 if "chatbot" not in st.session_state:
     try:
-        st.session_state.chatbot = load_chatbot(use_fasttext=use_fasttext)
-        st.session_state.use_fasttext = use_fasttext
+        st.session_state.chatbot = load_chatbot()
     except Exception as e:
         st.error(f"Klaida inicializuojant chatbot: {e}")
         st.stop()
 
-# Reload chatbot if FastText setting changed
-if st.session_state.get("use_fasttext") != use_fasttext:
-    try:
-        st.session_state.chatbot = load_chatbot(use_fasttext=use_fasttext)
-        st.session_state.use_fasttext = use_fasttext
-    except Exception as e:
-        st.error(f"Klaida perkraunant chatbot: {e}")
+# Precompute example question responses
+try:
+    example_responses = precompute_examples(st.session_state.chatbot, EXAMPLE_QUESTIONS, use_fasttext)
+except Exception as e:
+    st.error(f"Klaida ruošiant pavyzdinių klausimų atsakymus: {e}")
+    example_responses = {}
 
 # Display chat history
 for message in st.session_state.messages:
@@ -85,7 +96,7 @@ if prompt := st.chat_input("Užduokite klausimą..."):
     with st.chat_message("assistant"):
         with st.spinner("Galvoju..."):
             try:
-                response = st.session_state.chatbot.get_response(prompt)
+                response = st.session_state.chatbot.get_response(prompt, use_fasttext=use_fasttext)
                 st.markdown(response)
             except Exception as e:
                 error_msg = f"Atsiprašau, įvyko klaida apdorojant jūsų klausimą. Prašome bandyti dar kartą arba kreiptis į klientų aptarnavimo centrą."
@@ -99,33 +110,21 @@ if prompt := st.chat_input("Užduokite klausimą..."):
 # Example questions
 st.markdown("---")
 st.markdown("### Pavyzdiniai klausimai:")
-example_questions = [
-    "Kaip atsidaryti banko sąskaitą?",
-    "Kokios yra būsto paskolos palūkanos?",
-    "Kiek kainuoja SEPA pavedimas?",
-    "Ar indėliai apdrausti?",
-    "Ar galima keisti kortelės PIN kodą?"
-]
-
-cols = st.columns(len(example_questions))
-for i, question in enumerate(example_questions):
+cols = st.columns(len(EXAMPLE_QUESTIONS))
+for i, question in enumerate(EXAMPLE_QUESTIONS):
     with cols[i]:
         if st.button(question, key=f"example_{i}", use_container_width=True):
-            # Add example question to chat
-            st.session_state.messages.append({"role": "user", "content": question})
-            with st.chat_message("user"):
-                st.markdown(question)
-            
-            with st.chat_message("assistant"):
-                with st.spinner("Galvoju..."):
-                    try:
-                        response = st.session_state.chatbot.get_response(question)
-                        st.markdown(response)
-                    except Exception as e:
-                        error_msg = f"Atsiprašau, įvyko klaida apdorojant klausimą."
-                        st.markdown(error_msg)
-                        response = error_msg
+            # Add example question and its answer to chat; the rerun renders
+            # both through the chat history loop above
+            try:
+                if question in example_responses:
+                    response = example_responses[question]
+                else:
+                    response = st.session_state.chatbot.get_response(question, use_fasttext=use_fasttext)
+            except Exception as e:
+                response = f"Atsiprašau, įvyko klaida apdorojant klausimą."
             
+            st.session_state.messages.append({"role": "user", "content": question})
             st.session_state.messages.append({"role": "assistant", "content": response})
             st.rerun()
 
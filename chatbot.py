@@ -2,33 +2,141 @@
 Banking FAQ Chatbot using Word2Vec/fastText embeddings for semantic similarity.
 """
 
+import hashlib
 import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import gensim
 from gensim.models import Word2Vec, FastText
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from sklearn.metrics.pairwise import cosine_similarity
+# SciPy is a hard dependency of gensim, so BLAS is always available
+from scipy.linalg.blas import sgemv
 
-# Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    try:
-        nltk.download('punkt', quiet=True)
-    except Exception as e:
-        print(f"Warning: Could not download punkt tokenizer: {e}")
-        print("The app will use a fallback tokenization method.")
+    from numba import njit
+except ImportError:
+    njit = None
 
 try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    try:
-        nltk.download('stopwords', quiet=True)
-    except Exception as e:
-        print(f"Warning: Could not download stopwords: {e}")
-        print("The app will use a basic stopword list.")
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    from annoy import AnnoyIndex
+except ImportError:
+    AnnoyIndex = None
+
+# Lithuanian stopwords (NLTK does not ship a Lithuanian list)
+_LT_STOPWORDS = frozenset(('ir', 'bei', 'arba', 'taip', 'ne', 'kad', 'kur', 'kaip', 'kokie', 'kokia'))
+
+# Alphabetic tokens of at least 3 characters (Unicode-aware, so Lithuanian letters
+# match) that are not stopwords. The lookbehind keeps matches on word starts so a
+# rejected stopword is not matched again from its second letter.
+_STOPWORD_ALT = "|".join(re.escape(word) for word in sorted(_LT_STOPWORDS))
+_TOKEN_RE = re.compile(
+    rf"(?<![^\W\d_])(?!(?:{_STOPWORD_ALT})(?![^\W\d_]))[^\W\d_]{{3,}}", re.UNICODE
+)
+
+# Word2Vec/FastText training parameters; also part of the model cache key
+EMBEDDING_PARAMS = {
+    "vector_size": 100,
+    "window": 5,
+    "min_count": 1,
+    "workers": 4,
+    "sg": 1,  # Skip-gram
+}
+
+# Directory where trained models and question embeddings are persisted,
+# in one subdirectory per FAQ file
+CACHE_DIR = ".cache"
+
+# Set BANKING_CHATBOT_ANN=1 to look questions up through an Annoy index
+# instead of brute-force scoring (useful only for large FAQ databases)
+USE_ANN_INDEX = os.environ.get("BANKING_CHATBOT_ANN", "0") == "1"
+ANN_TREES = 10
+
+# Cache entries are named after a SHA-1 hex key
+_CACHE_KEY_RE = re.compile(r"[0-9a-f]{40}(?:\.|$)")
+
+# Response given when no FAQ question is similar enough
+FALLBACK_RESPONSE = "Atsiprašau, bet negaliu rasti tinkamo atsakymo į jūsų klausimą. Prašome kreiptis į klientų aptarnavimo centrą telefonu 1888 arba atvykti į filialą."
+
+# Maximum number of cached responses kept per chatbot instance
+RESPONSE_CACHE_SIZE = 512
+
+
+def _best_match_numpy(question_embeddings: np.ndarray, user_embedding: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> Tuple[int, float]:
+    """
+    Find the most similar row of pre-normalized question embeddings.
+    
+    Args:
+        question_embeddings: L2-normalized float32 matrix, one row per question
+        user_embedding: Unnormalized float32 query vector
+        out: Optional preallocated float32 buffer for the similarity scores
+        
+    Returns:
+        Tuple of (best_index, cosine_similarity)
+    """
+    norm = np.linalg.norm(user_embedding)
+    if not norm:
+        return 0, 0.0
+    if simsimd is not None:
+        # SimSIMD's cosine kernels normalize internally, so the raw query is used
+        distances = simsimd.cdist(user_embedding.reshape(1, -1), question_embeddings, metric='cosine')
+        similarities = 1.0 - np.asarray(distances)[0]
+    else:
+        # Call BLAS directly on the Fortran-ordered view of the C-contiguous
+        # matrix (trans=1) so neither operand is copied or promoted
+        if out is None:
+            similarities = sgemv(1.0, question_embeddings.T, user_embedding / norm, trans=1)
+        else:
+            similarities = sgemv(1.0, question_embeddings.T, user_embedding / norm,
+                                 beta=0.0, y=out, overwrite_y=1, trans=1)
+    best_idx = int(similarities.argmax())
+    return best_idx, float(similarities[best_idx])
+
+
+if njit is not None:
+    # fastmath without 'nnan'/'ninf': the kernel must be able to rely on
+    # comparisons, so only the flags that permit SIMD reductions are enabled
+    @njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _best_match_numba(question_embeddings, user_embedding):
+        # Fused dot product + argmax in a single pass, no temporary arrays;
+        # returns the same result as _best_match_numpy
+        n_rows, dim = question_embeddings.shape
+        user_norm_sq = np.float32(0.0)
+        for j in range(dim):
+            user_norm_sq += user_embedding[j] * user_embedding[j]
+        if n_rows == 0 or user_norm_sq == 0:
+            return 0, 0.0
+        best_idx = 0
+        best = np.float32(0.0)
+        for i in range(n_rows):
+            s = np.float32(0.0)
+            for j in range(dim):
+                s += question_embeddings[i, j] * user_embedding[j]
+            if i == 0 or s > best:
+                best = s
+                best_idx = i
+        return best_idx, best / np.sqrt(user_norm_sq)
+
+
+class _Backend(NamedTuple):
+    """Immutable state of one embedding backend (Word2Vec or FastText)."""
+    use_fasttext: bool
+    cache_key: str
+    model: Any
+    key_to_index: Dict[str, int]
+    vectors: np.ndarray
+    question_embeddings: Optional[np.ndarray] = None
+    ann: Any = None
 
 
 class BankingChatbot:
@@ -40,42 +148,141 @@ class BankingChatbot:
         
         Args:
             faq_file: Path to JSON file with FAQ data
-            use_fasttext: If True, use FastText, otherwise use Word2Vec
+            use_fasttext: Default backend for queries that do not pass one;
+                if True, use FastText, otherwise use Word2Vec
         """
-        self.use_fasttext = use_fasttext
+        self.use_fasttext = bool(use_fasttext)
         self.faq_data = self._load_faq_data(faq_file)
         self.questions = [item["question"] for item in self.faq_data]
         self.answers = [item["answer"] for item in self.faq_data]
         # Extract topics if available (backward compatible)
         self.topics = [item.get("topic", None) for item in self.faq_data]
         
-        # Lithuanian stopwords
-        self.stop_words = set()
-        try:
-            self.stop_words = set(stopwords.words('lithuanian'))
-        except (LookupError, Exception):
-            try:
-                nltk.download('stopwords', quiet=True)
-                self.stop_words = set(stopwords.words('lithuanian'))
-            except (LookupError, Exception):
-                try:
-                    # Fallback to English if Lithuanian not available
-                    self.stop_words = set(stopwords.words('english'))
-                except (LookupError, Exception):
-                    # Final fallback: use minimal stopword list
-                    self.stop_words = set()
-        
-        # Add common Lithuanian stopwords manually if needed
-        self.stop_words.update(['ir', 'bei', 'arba', 'taip', 'ne', 'kad', 'kur', 'kaip', 'kokie', 'kokia'])
+        self.stop_words = _LT_STOPWORDS
         
         # Preprocess questions
         self.processed_questions = [self._preprocess_text(q) for q in self.questions]
         
-        # Train or load embeddings
-        self.model = self._train_embeddings()
+        # Cache entries are kept per FAQ file, so instances using different
+        # files never prune each other's models; stale ones are dropped here
+        faq_path = os.path.abspath(faq_file).encode('utf-8')
+        self._cache_dir = os.path.join(CACHE_DIR, hashlib.sha1(faq_path).hexdigest()[:16])
+        self._remove_stale_cache_entries()
+        
+        # LRU cache of responses keyed on the normalized prompt and backend;
+        # guarded by a lock since one instance may serve concurrent sessions
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
+        # Per-thread similarity buffers reused across queries; a single instance
+        # may serve several Streamlit sessions concurrently
+        self._local = threading.local()
+        
+        # Per-backend state, loaded lazily and never mutated afterwards, so
+        # concurrent queries on different backends do not interfere
+        self._backends = {}
+        self._backends_lock = threading.Lock()
+        self._get_backend(self.use_fasttext)
+    
+    def _get_backend(self, use_fasttext: Optional[bool] = None) -> _Backend:
+        """
+        Get the state of a backend, training or loading it on first use.
+        
+        Args:
+            use_fasttext: If True, FastText, if False, Word2Vec; None selects
+                the default backend chosen at construction
+            
+        Returns:
+            Backend state
+        """
+        use_fasttext = self.use_fasttext if use_fasttext is None else bool(use_fasttext)
+        backend = self._backends.get(use_fasttext)
+        if backend is None:
+            with self._backends_lock:
+                backend = self._backends.get(use_fasttext)
+                if backend is None:
+                    backend = self._backends[use_fasttext] = self._load_backend(use_fasttext)
+        return backend
+    
+    def _load_backend(self, use_fasttext: bool) -> _Backend:
+        """
+        Train or load embeddings for a backend and precompute question embeddings.
+        
+        Args:
+            use_fasttext: If True, use FastText, otherwise use Word2Vec
+            
+        Returns:
+            Backend state
+        """
+        # Load the model and its question embeddings from the cache, or train
+        cache_key = self._compute_cache_key(use_fasttext)
+        entry_dir = os.path.join(self._cache_dir, cache_key)
+        cached = self._load_cache_entry(use_fasttext, entry_dir)
+        if cached is not None:
+            model, question_embeddings = cached
+        else:
+            model, question_embeddings = self._train_embeddings(use_fasttext), None
+        
+        # Cache the vocabulary index and vector matrix so the query path
+        # bypasses gensim's KeyedVectors wrapper entirely
+        backend = _Backend(
+            use_fasttext=use_fasttext,
+            cache_key=cache_key,
+            model=model,
+            key_to_index=dict(model.wv.key_to_index),
+            vectors=np.ascontiguousarray(model.wv.vectors, dtype=np.float32),
+        )
+        
+        if question_embeddings is None:
+            # Precompute question embeddings, L2-normalized once so that
+            # cosine similarity at query time reduces to a plain dot product
+            embeddings = self._compute_embeddings(self.processed_questions, backend)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1
+            question_embeddings = np.ascontiguousarray(embeddings / norms, dtype=np.float32)
+            try:
+                # Serve the matrix from the memory-mapped .npy so that all
+                # processes share one copy through the OS page cache; if another
+                # process published its entry first, keep this model's own matrix
+                if self._save_cache_entry(model, question_embeddings, entry_dir):
+                    question_embeddings = np.load(
+                        os.path.join(entry_dir, "question_embeddings.npy"), mmap_mode='r'
+                    )
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not save trained model: {e}")
+        
+        # Optional approximate nearest-neighbour index for sub-linear lookup
+        ann = self._build_ann_index(question_embeddings) if USE_ANN_INDEX and AnnoyIndex is not None else None
+        
+        return backend._replace(question_embeddings=question_embeddings, ann=ann)
+    
+    def _similarity_buffer(self) -> np.ndarray:
+        """
+        Get this thread's preallocated buffer for question similarity scores.
+        
+        Returns:
+            Float32 array with one slot per FAQ question
+        """
+        buffer = getattr(self._local, "similarities", None)
+        if buffer is None:
+            buffer = self._local.similarities = np.empty(len(self.questions), dtype=np.float32)
+        return buffer
+    
+    def _build_ann_index(self, question_embeddings: np.ndarray):
+        """
+        Build an Annoy index over the question embeddings.
         
-        # Precompute question embeddings
-        self.question_embeddings = self._compute_embeddings(self.processed_questions)
+        Args:
+            question_embeddings: L2-normalized question embedding matrix
+            
+        Returns:
+            Built AnnoyIndex using angular distance
+        """
+        index = AnnoyIndex(question_embeddings.shape[1], 'angular')
+        for i, vector in enumerate(question_embeddings):
+            index.add_item(i, vector)
+        index.build(ANN_TREES)
+        return index
     
     def _load_faq_data(self, faq_file: str) -> List[dict]:
         """Load FAQ data from JSON file."""
@@ -92,108 +299,220 @@ class BankingChatbot:
         Returns:
             List of processed tokens
         """
-        import re
-        
-        # Convert to lowercase
-        text = text.lower()
+        return _TOKEN_RE.findall(text.lower())
+    
+    def _compute_cache_key(self, use_fasttext: bool) -> str:
+        """
+        Compute a stable key identifying the model backend, training
+        parameters, gensim version and training data.
         
-        # Tokenize - try NLTK first, fallback to regex if it fails
-        try:
-            tokens = word_tokenize(text)
-        except Exception:
-            # Fallback to simple regex tokenization if NLTK fails
-            tokens = re.findall(r'\b\w+\b', text)
-        
-        # Remove stopwords and non-alphabetic tokens
-        tokens = [
-            token for token in tokens 
-            if token.isalpha() and token not in self.stop_words and len(token) > 2
-        ]
-        
-        return tokens
+        Args:
+            use_fasttext: If True, FastText, otherwise Word2Vec
+            
+        Returns:
+            Hex digest naming the cache entry (model and question embeddings)
+        """
+        payload = json.dumps(
+            [use_fasttext, EMBEDDING_PARAMS, gensim.__version__, self.processed_questions],
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
     
-    def _train_embeddings(self):
+    def _train_embeddings(self, use_fasttext: bool):
         """
         Train Word2Vec or FastText model on FAQ questions.
         
+        Args:
+            use_fasttext: If True, use FastText, otherwise use Word2Vec
+            
         Returns:
             Trained embedding model
         """
+        model_class = FastText if use_fasttext else Word2Vec
+        
         # Combine all processed questions for training
         sentences = self.processed_questions
         
         # Train model
-        if self.use_fasttext:
-            model = FastText(
-                sentences=sentences,
-                vector_size=100,
-                window=5,
-                min_count=1,
-                workers=4,
-                sg=1  # Skip-gram
-            )
-        else:
-            model = Word2Vec(
-                sentences=sentences,
-                vector_size=100,
-                window=5,
-                min_count=1,
-                workers=4,
-                sg=1  # Skip-gram
-            )
+        return model_class(sentences=sentences, **EMBEDDING_PARAMS)
+    
+    def _load_cache_entry(self, use_fasttext: bool, entry_dir: str):
+        """
+        Memory-map a cached model and the question embeddings computed with it.
+        
+        A cache entry that cannot be loaded is removed so it can be rebuilt.
+        
+        Args:
+            use_fasttext: If True, FastText, otherwise Word2Vec
+            entry_dir: Cache directory holding the model and its embeddings
+            
+        Returns:
+            Tuple of (model, question_embeddings), or None if there is no
+            usable cache entry
+        """
+        model_path = os.path.join(entry_dir, "model")
+        if not os.path.exists(model_path):
+            return None
+        
+        model_class = FastText if use_fasttext else Word2Vec
+        try:
+            model = model_class.load(model_path, mmap='r')
+            question_embeddings = np.load(os.path.join(entry_dir, "question_embeddings.npy"), mmap_mode='r')
+            if question_embeddings.shape != (len(self.questions), model.vector_size):
+                raise ValueError("cached question embeddings do not match the FAQ")
+        except Exception as e:
+            print(f"Warning: Could not load cached model, retraining: {e}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+        
+        return model, question_embeddings
+    
+    def _save_cache_entry(self, model, question_embeddings: np.ndarray, entry_dir: str) -> bool:
+        """
+        Atomically save a trained model and its question embeddings.
+        
+        Both are written into a temporary directory in the cache directory
+        which is then renamed to entry_dir, so the entry only becomes visible
+        once complete and the embeddings always belong to the model next to them.
+        
+        Args:
+            model: Trained Word2Vec or FastText model
+            question_embeddings: Normalized question embeddings computed with model
+            entry_dir: Final cache directory for the entry
+            
+        Returns:
+            True if this entry was published, False if another process
+            published one first (its entry is kept and this one discarded)
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=self._cache_dir, prefix=f"{os.path.basename(entry_dir)}.tmp-")
+        try:
+            model.save(os.path.join(tmp_dir, "model"))
+            np.save(os.path.join(tmp_dir, "question_embeddings.npy"), question_embeddings)
+            # mkdtemp creates a 0700 directory; let workers running as other users read it
+            os.chmod(tmp_dir, 0o755)
+            try:
+                os.replace(tmp_dir, entry_dir)
+            except OSError:
+                if not os.path.isdir(entry_dir):
+                    raise
+                return False
+            return True
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def _remove_stale_cache_entries(self):
+        """
+        Remove cached models and embeddings of this FAQ file whose key matches
+        neither backend for the current questions and training setup.
         
-        return model
+        Temporary directories for the current keys are kept, since another
+        process may still be writing them.
+        """
+        if not os.path.isdir(self._cache_dir):
+            return
+        
+        current_keys = [self._compute_cache_key(use_fasttext) for use_fasttext in (False, True)]
+        keep_names = set(current_keys)
+        keep_prefixes = tuple(f"{key}.tmp-" for key in current_keys)
+        
+        for name in os.listdir(self._cache_dir):
+            # Only touch entries written by this class (named after SHA-1 hex keys)
+            if not _CACHE_KEY_RE.match(name):
+                continue
+            if name in keep_names or name.startswith(keep_prefixes):
+                continue
+            path = os.path.join(self._cache_dir, name)
+            try:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            except OSError as e:
+                print(f"Warning: Could not remove stale cache entry {name}: {e}")
     
-    def _get_sentence_embedding(self, tokens: List[str]) -> np.ndarray:
+    def _get_sentence_embedding(self, tokens: List[str], backend: _Backend) -> np.ndarray:
         """
         Get embedding for a sentence by averaging word embeddings.
         
         Args:
             tokens: List of tokens
+            backend: Backend state to embed with
             
         Returns:
             Sentence embedding vector
         """
         if not tokens:
-            return np.zeros(self.model.vector_size)
+            return np.zeros(backend.model.vector_size, dtype=np.float32)
         
-        embeddings = []
-        for token in tokens:
-            if token in self.model.wv:
-                embeddings.append(self.model.wv[token])
-            elif self.use_fasttext:
-                # FastText can handle out-of-vocabulary words
-                embeddings.append(self.model.wv[token])
+        key_to_index = backend.key_to_index
+        get = key_to_index.get
+        idx = [i for i in map(get, tokens) if i is not None]
+        vectors = backend.vectors[idx]
         
-        if not embeddings:
-            return np.zeros(self.model.vector_size)
+        if backend.use_fasttext and len(idx) < len(tokens):
+            # FastText can handle out-of-vocabulary words via subword n-grams
+            oov = [token for token in tokens if token not in key_to_index]
+            vectors = np.vstack((vectors, backend.model.wv[oov].astype(np.float32, copy=False)))
         
-        return np.mean(embeddings, axis=0)
+        if not len(vectors):
+            return np.zeros(backend.model.vector_size, dtype=np.float32)
+        
+        return vectors.mean(axis=0)
     
-    def _compute_embeddings(self, processed_texts: List[List[str]]) -> np.ndarray:
+    def _compute_embeddings(self, processed_texts: List[List[str]], backend: _Backend) -> np.ndarray:
         """
         Compute embeddings for all processed texts.
         
         Args:
             processed_texts: List of processed text tokens
+            backend: Backend state to embed with
             
         Returns:
-            Array of embeddings
+            C-contiguous float32 array of embeddings, one row per text
         """
-        embeddings = []
-        for tokens in processed_texts:
-            embedding = self._get_sentence_embedding(tokens)
-            embeddings.append(embedding)
+        vector_size = backend.model.vector_size
+        out = np.zeros((len(processed_texts), vector_size), dtype=np.float32)
+        
+        # Flatten all rows into one token list and map each token to its row
+        all_tokens = [token for tokens in processed_texts for token in tokens]
+        rows = np.repeat(np.arange(len(processed_texts)), [len(tokens) for tokens in processed_texts])
+        get = backend.key_to_index.get
+        flat_ids = np.fromiter((get(token, -1) for token in all_tokens), dtype=np.int64, count=len(all_tokens))
+        known = flat_ids >= 0
+        
+        if backend.use_fasttext:
+            # FastText can handle out-of-vocabulary words via subword n-grams
+            flat_vectors = np.empty((len(all_tokens), vector_size), dtype=np.float32)
+            flat_vectors[known] = backend.vectors[flat_ids[known]]
+            oov_positions = np.flatnonzero(~known)
+            if len(oov_positions):
+                flat_vectors[oov_positions] = backend.model.wv[[all_tokens[i] for i in oov_positions]]
+        else:
+            flat_vectors = backend.vectors[flat_ids[known]]
+            rows = rows[known]
+        
+        if not len(flat_vectors):
+            return out
         
-        return np.array(embeddings)
+        # Average each row's vectors with a single segmented reduction;
+        # rows without any vectors keep their zero embedding
+        counts = np.bincount(rows, minlength=len(processed_texts))
+        nonempty = counts > 0
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))[nonempty]
+        out[nonempty] = np.add.reduceat(flat_vectors, offsets, axis=0) / counts[nonempty, None]
+        
+        return out
     
-    def find_best_match(self, user_input: str, threshold: float = 0.3) -> Tuple[Optional[str], float, Optional[str]]:
+    def find_best_match(self, user_input: str, threshold: float = 0.3,
+                        use_fasttext: Optional[bool] = None) -> Tuple[Optional[str], float, Optional[str]]:
         """
         Find the best matching FAQ answer for user input.
         
         Args:
             user_input: User's question
             threshold: Minimum similarity threshold
+            use_fasttext: Backend to use; None selects the default backend
             
         Returns:
             Tuple of (answer, similarity_score, topic) or (None, 0.0, None) if no match found
@@ -204,42 +523,114 @@ class BankingChatbot:
         if not processed_input:
             return None, 0.0, None
         
+        # Read the backend state once so the whole query sees one backend
+        backend = self._get_backend(use_fasttext)
+        
         # Get embedding for user input
-        user_embedding = self._get_sentence_embedding(processed_input)
-        user_embedding = user_embedding.reshape(1, -1)
+        user_embedding = self._get_sentence_embedding(processed_input, backend).astype(np.float32, copy=False)
+        
+        if backend.ann is not None:
+            ids, distances = backend.ann.get_nns_by_vector(user_embedding, 1, include_distances=True)
+            # Annoy's angular distance is sqrt(2 * (1 - cos))
+            best_idx, best_similarity = ids[0], 1.0 - distances[0] ** 2 / 2
+        elif njit is not None:
+            # Question embeddings are pre-normalized, so cosine similarity is a dot product
+            best_idx, best_similarity = _best_match_numba(backend.question_embeddings, user_embedding)
+        else:
+            best_idx, best_similarity = _best_match_numpy(
+                backend.question_embeddings, user_embedding, out=self._similarity_buffer()
+            )
         
-        # Calculate cosine similarity with all questions
-        similarities = cosine_similarity(user_embedding, self.question_embeddings)[0]
+        return self._match_result(best_idx, best_similarity, threshold)
+    
+    def find_best_matches(self, user_inputs: List[str], threshold: float = 0.3,
+                          use_fasttext: Optional[bool] = None) -> List[Tuple[Optional[str], float, Optional[str]]]:
+        """
+        Find the best matching FAQ answers for several user inputs at once.
         
-        # Find best match
-        best_idx = np.argmax(similarities)
-        best_similarity = similarities[best_idx]
+        All queries are scored with a single matrix-matrix product.
         
+        Args:
+            user_inputs: User questions
+            threshold: Minimum similarity threshold
+            use_fasttext: Backend to use; None selects the default backend
+            
+        Returns:
+            List of (answer, similarity_score, topic) tuples, one per input,
+            as returned by find_best_match
+        """
+        processed_inputs = [self._preprocess_text(user_input) for user_input in user_inputs]
+        if not processed_inputs:
+            return []
+        
+        backend = self._get_backend(use_fasttext)
+        
+        # Embed and L2-normalize all queries; empty rows stay zero
+        user_embeddings = self._compute_embeddings(processed_inputs, backend)
+        norms = np.linalg.norm(user_embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        user_embeddings /= norms
+        
+        similarities = user_embeddings @ backend.question_embeddings.T
+        best_indices = similarities.argmax(axis=1)
+        best_similarities = similarities[np.arange(len(processed_inputs)), best_indices]
+        
+        results = []
+        for processed_input, best_idx, best_similarity in zip(processed_inputs, best_indices, best_similarities):
+            if not processed_input:
+                results.append((None, 0.0, None))
+            else:
+                results.append(self._match_result(int(best_idx), float(best_similarity), threshold))
+        return results
+    
+    def _match_result(self, best_idx: int, best_similarity: float, threshold: float) -> Tuple[Optional[str], float, Optional[str]]:
+        """Build the (answer, similarity_score, topic) tuple for a best match."""
         if best_similarity >= threshold:
             topic = self.topics[best_idx] if best_idx < len(self.topics) else None
             return self.answers[best_idx], best_similarity, topic
         
         return None, best_similarity, None
     
-    def get_response(self, user_input: str, include_topic: bool = False) -> str:
+    def get_response(self, user_input: str, include_topic: bool = False,
+                     use_fasttext: Optional[bool] = None) -> str:
         """
         Get chatbot response for user input.
         
         Args:
             user_input: User's question
             include_topic: If True, include topic information in response
+            use_fasttext: Backend to use; None selects the default backend
             
         Returns:
             Chatbot response (with optional topic prefix)
         """
-        answer, similarity, topic = self.find_best_match(user_input)
+        use_fasttext = self.use_fasttext if use_fasttext is None else bool(use_fasttext)
+        key = (user_input.strip().lower(), include_topic, use_fasttext)
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                return cached
+        
+        response = self._build_response(user_input, include_topic, use_fasttext)
+        
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        
+        return response
+    
+    def _build_response(self, user_input: str, include_topic: bool, use_fasttext: bool) -> str:
+        """Compute the chatbot response for user input without caching."""
+        answer, similarity, topic = self.find_best_match(user_input, use_fasttext=use_fasttext)
         
         if answer:
             if include_topic and topic:
                 return f"[{topic.upper()}] {answer}"
             return answer
         else:
-            return "Atsiprašau, bet negaliu rasti tinkamo atsakymo į jūsų klausimą. Prašome kreiptis į klientų aptarnavimo centrą telefonu 1888 arba atvykti į filialą."
+            return FALLBACK_RESPONSE
     
     def get_available_topics(self) -> List[str]:
         """
@@ -251,20 +642,21 @@ class BankingChatbot:
         unique_topics = list(set([topic for topic in self.topics if topic is not None]))
         return sorted(unique_topics)
     
-    def get_response_with_metadata(self, user_input: str) -> dict:
+    def get_response_with_metadata(self, user_input: str, use_fasttext: Optional[bool] = None) -> dict:
         """
         Get chatbot response with metadata (answer, topic, similarity score).
         
         Args:
             user_input: User's question
+            use_fasttext: Backend to use; None selects the default backend
             
         Returns:
             Dictionary with 'answer', 'topic', and 'similarity' keys
         """
-        answer, similarity, topic = self.find_best_match(user_input)
+        answer, similarity, topic = self.find_best_match(user_input, use_fasttext=use_fasttext)
         
         return {
-            "answer": answer if answer else "Atsiprašau, bet negaliu rasti tinkamo atsakymo į jūsų klausimą. Prašome kreiptis į klientų aptarnavimo centrą telefonu 1888 arba atvykti į filialą.",
+            "answer": answer if answer else FALLBACK_RESPONSE,
             "topic": topic,
             "similarity": float(similarity),
             "found": answer is not None
@@ -286,8 +678,9 @@ if __name__ == "__main__":
     print("Banking Chatbot - Test Run\n")
     print("=" * 50)
     
-    for question in test_questions:
-        response = chatbot.get_response(question)
+    matches = chatbot.find_best_matches(test_questions)
+    for question, (answer, similarity, topic) in zip(test_questions, matches):
+        response = answer if answer else FALLBACK_RESPONSE
         print(f"\nKlausimas: {question}")
         print(f"Atsakymas: {response}")
         print("-" * 50)